@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from backend.chat import rephrase_query_with_history
 from backend.constants import get_model_string
 from backend.db.chat import save_turn_to_db
-from backend.llm.base import BaseLLM, EveryLLM
+from backend.llm.base import BaseLLM, get_llm
 from backend.prompts import CHAT_PROMPT, QUERY_PLAN_PROMPT, SEARCH_QUERY_PROMPT
 from backend.related_queries import generate_related_queries
 from backend.schemas import (
@@ -115,9 +115,8 @@ async def stream_pro_search_objects(
     query_plan = llm.structured_complete(
         response_model=QueryPlan, prompt=query_plan_prompt
     )
-    print(query_plan)
 
-    yield ChatResponseEvent(
+    yield ChatResponseEvent.model_construct(
         event=StreamEvent.AGENT_QUERY_PLAN,
         data=AgentQueryPlanStream(steps=[step.step for step in query_plan.steps]),
     )
@@ -150,7 +149,7 @@ async def stream_pro_search_objects(
                     detail="There was an error generating the search queries",
                 )
 
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.AGENT_SEARCH_QUERIES,
                 data=AgentSearchQueriesStream(
                     queries=search_queries, step_number=step_id
@@ -164,7 +163,7 @@ async def stream_pro_search_objects(
             search_result_map[step_id] = search_results
             image_map[step_id] = image_results
 
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.AGENT_READ_RESULTS,
                 data=AgentReadResultsStream(
                     results=search_results, step_number=step_id
@@ -183,12 +182,12 @@ async def stream_pro_search_objects(
                 )
             )
         else:
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.AGENT_FINISH,
                 data=AgentFinishStream(),
             )
 
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.BEGIN_STREAM,
                 data=BeginStream(query=query),
             )
@@ -224,7 +223,7 @@ async def stream_pro_search_objects(
                     generate_related_queries(query, search_results, llm)
                 )
 
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.SEARCH_RESULTS,
                 data=SearchResultStream(
                     results=search_results,
@@ -241,7 +240,7 @@ async def stream_pro_search_objects(
             response_gen = await llm.astream(fmt_qa_prompt)
             async for completion in response_gen:
                 full_response += completion.delta or ""
-                yield ChatResponseEvent(
+                yield ChatResponseEvent.model_construct(
                     event=StreamEvent.TEXT_CHUNK,
                     data=TextChunkStream(text=completion.delta or ""),
                 )
@@ -252,12 +251,12 @@ async def stream_pro_search_objects(
                 else generate_related_queries(query, search_results, llm)
             )
 
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.RELATED_QUERIES,
                 data=RelatedQueriesStream(related_queries=related_queries),
             )
 
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.FINAL_RESPONSE,
                 data=FinalResponseStream(message=full_response),
             )
@@ -266,8 +265,6 @@ async def stream_pro_search_objects(
                 AgentSearchStep(
                     step_number=step_id,
                     step=step.step,
-                    queries=[],
-                    results=[],
                     status=AgentSearchStepStatus.DONE,
                 )
             )
@@ -287,7 +284,7 @@ async def stream_pro_search_objects(
                 related_queries=related_queries,
             )
 
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.STREAM_END,
                 data=StreamEndStream(thread_id=thread_id),
             )
@@ -305,12 +302,11 @@ async def stream_pro_search_qa(
             )
 
         model_name = get_model_string(request.model)
-        llm = EveryLLM(model=model_name)
+        llm = get_llm(model_name)
 
         query = rephrase_query_with_history(request.query, request.history, llm)
         async for event in stream_pro_search_objects(request, llm, query, session):
             yield event
-            await asyncio.sleep(0)
 
     except Exception as e:
         detail = str(e)
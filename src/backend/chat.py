@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from backend.constants import get_model_string
 from backend.db.chat import save_turn_to_db
-from backend.llm.base import BaseLLM, EveryLLM
+from backend.llm.base import BaseLLM, get_llm
 from backend.prompts import CHAT_PROMPT, HISTORY_QUERY_REPHRASE
 from backend.related_queries import generate_related_queries
 from backend.schemas import (
@@ -56,9 +56,9 @@ async def stream_qa_objects(
 ) -> AsyncIterator[ChatResponseEvent]:
     try:
         model_name = get_model_string(request.model)
-        llm = EveryLLM(model=model_name)
+        llm = get_llm(model_name)
 
-        yield ChatResponseEvent(
+        yield ChatResponseEvent.model_construct(
             event=StreamEvent.BEGIN_STREAM,
             data=BeginStream(query=request.query),
         )
@@ -77,7 +77,7 @@ async def stream_qa_objects(
                 generate_related_queries(query, search_results, llm)
             )
 
-        yield ChatResponseEvent(
+        yield ChatResponseEvent.model_construct(
             event=StreamEvent.SEARCH_RESULTS,
             data=SearchResultStream(
                 results=search_results,
@@ -94,7 +94,7 @@ async def stream_qa_objects(
         response_gen = await llm.astream(fmt_qa_prompt)
         async for completion in response_gen:
             full_response += completion.delta or ""
-            yield ChatResponseEvent(
+            yield ChatResponseEvent.model_construct(
                 event=StreamEvent.TEXT_CHUNK,
                 data=TextChunkStream(text=completion.delta or ""),
             )
@@ -105,7 +105,7 @@ async def stream_qa_objects(
             else generate_related_queries(query, search_results, llm)
         )
 
-        yield ChatResponseEvent(
+        yield ChatResponseEvent.model_construct(
             event=StreamEvent.RELATED_QUERIES,
             data=RelatedQueriesStream(related_queries=related_queries),
         )
@@ -121,12 +121,12 @@ async def stream_qa_objects(
             related_queries=related_queries,
         )
 
-        yield ChatResponseEvent(
+        yield ChatResponseEvent.model_construct(
             event=StreamEvent.FINAL_RESPONSE,
             data=FinalResponseStream(message=full_response),
         )
 
-        yield ChatResponseEvent(
+        yield ChatResponseEvent.model_construct(
             event=StreamEvent.STREAM_END,
             data=StreamEndStream(thread_id=thread_id),
         )
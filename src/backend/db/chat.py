@@ -1,8 +1,7 @@
-import json
 import re
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import ScalarSelect, func, insert, select
+from sqlalchemy.orm import Session, aliased, load_only, selectinload
 
 from backend.db.models import ChatMessage as DBChatMessage
 from backend.db.models import ChatThread as DBChatThread
@@ -17,29 +16,32 @@ from backend.schemas import (
 )
 from backend.utils import DB_ENABLED
 
+CITATION_REGEX = re.compile(r"\[[0-9]+\]")
 
-def create_chat_thread(*, session: Session, model_name: str):
-    chat_thread = DBChatThread(model_name=model_name)
-    session.add(chat_thread)
-    session.commit()
-    return chat_thread
+
+def create_chat_thread(*, session: Session, model_name: str) -> int:
+    return session.execute(
+        insert(DBChatThread).values(model_name=model_name).returning(DBChatThread.id)
+    ).scalar_one()
 
 
 def create_search_results(
     *, session: Session, search_results: list[SearchResult], chat_message_id: int
-) -> list[DBSearchResult]:
-    db_search_results = [
-        DBSearchResult(
-            url=result.url,
-            title=result.title,
-            content=result.content,
-            chat_message_id=chat_message_id,
-        )
-        for result in search_results
-    ]
-    session.add_all(db_search_results)
-    session.commit()
-    return db_search_results
+) -> None:
+    if not search_results:
+        return
+    session.execute(
+        insert(DBSearchResult),
+        [
+            {
+                "url": result.url,
+                "title": result.title,
+                "content": result.content,
+                "chat_message_id": chat_message_id,
+            }
+            for result in search_results
+        ],
+    )
 
 
 def append_message(
@@ -51,12 +53,12 @@ def append_message(
     search_results: list[SearchResult] | None = None,
     image_results: list[str] | None = None,
     related_queries: list[str] | None = None,
-):
-    last_message = (
-        session.query(DBChatMessage)
-        .filter(DBChatMessage.chat_thread_id == thread_id)
-        .order_by(DBChatMessage.id.desc())
-        .first()
+) -> int:
+    # Resolve the parent inside the INSERT instead of a separate SELECT
+    last_message_id = (
+        select(func.max(DBChatMessage.id))
+        .where(DBChatMessage.chat_thread_id == thread_id)
+        .scalar_subquery()
     )
 
     return create_message(
@@ -64,7 +66,7 @@ def append_message(
         thread_id=thread_id,
         role=role,
         content=content,
-        parent_message_id=last_message.id if last_message else None,
+        parent_message_id=last_message_id,
         search_results=search_results,
         image_results=image_results,
         related_queries=related_queries,
@@ -77,39 +79,35 @@ def create_message(
     thread_id: int,
     role: MessageRole,
     content: str,
-    parent_message_id: int | None = None,
+    parent_message_id: int | ScalarSelect[int] | None = None,
     agent_search_full_response: AgentSearchFullResponse | None = None,
     search_results: list[SearchResult] | None = None,
     image_results: list[str] | None = None,
     related_queries: list[str] | None = None,
-):
-    message = DBChatMessage(
-        chat_thread_id=thread_id,
-        role=role,
-        content=content,
-        parent_message_id=parent_message_id,
-        agent_search_full_response=(
-            agent_search_full_response.model_dump_json()
-            if agent_search_full_response
-            else None
-        ),
-        image_results=image_results or [],
-        related_queries=related_queries or [],
-    )
-
-    session.add(message)
-    session.flush()
+) -> int:
+    message_id = session.execute(
+        insert(DBChatMessage)
+        .values(
+            chat_thread_id=thread_id,
+            role=role,
+            content=content,
+            parent_message_id=parent_message_id,
+            agent_search_full_response=(
+                agent_search_full_response.model_dump(mode="json")
+                if agent_search_full_response
+                else None
+            ),
+            image_results=image_results or [],
+            related_queries=related_queries or [],
+        )
+        .returning(DBChatMessage.id)
+    ).scalar_one()
 
-    db_search_results = None
     if search_results is not None:
-        db_search_results = create_search_results(
-            session=session, search_results=search_results, chat_message_id=message.id
+        create_search_results(
+            session=session, search_results=search_results, chat_message_id=message_id
         )
-    message.search_results = db_search_results or []
-
-    session.add(message)
-    session.commit()
-    return message
+    return message_id
 
 
 def save_turn_to_db(
@@ -126,56 +124,80 @@ def save_turn_to_db(
 ) -> int | None:
     if DB_ENABLED:
         if thread_id is None:
-            thread = create_chat_thread(session=session, model_name=model)
-            thread_id = thread.id
-        else:
-            thread_id = thread_id
+            thread_id = create_chat_thread(session=session, model_name=model)
 
-        user_message = append_message(
+        user_message_id = append_message(
             session=session,
             thread_id=thread_id,
             role=MessageRole.USER,
             content=user_message,
         )
 
-        _assistant_message = create_message(
+        create_message(
             session=session,
             thread_id=thread_id,
             role=MessageRole.ASSISTANT,
             content=assistant_message,
-            parent_message_id=user_message.id,
+            parent_message_id=user_message_id,
             agent_search_full_response=agent_search_full_response,
             search_results=search_results,
             image_results=image_results,
             related_queries=related_queries,
         )
+        session.commit()
         return thread_id
     return None
 
 
 def get_chat_history(*, session: Session) -> list[ChatSnapshot]:
-    threads = (
-        session.query(DBChatThread)
-        .join(DBChatThread.messages)
-        .options(contains_eager(DBChatThread.messages))
-        .order_by(DBChatThread.time_created.desc(), DBChatMessage.id.asc())
-        .all()
+    # Rank only message ids, so the window never reads message content, and
+    # keep the ids of each thread's first two messages
+    ranked_messages = select(
+        DBChatMessage.id,
+        DBChatMessage.chat_thread_id,
+        func.row_number()
+        .over(partition_by=DBChatMessage.chat_thread_id, order_by=DBChatMessage.id)
+        .label("position"),
+    ).subquery("ranked_messages")
+    first_messages = (
+        select(
+            ranked_messages.c.chat_thread_id,
+            func.min(ranked_messages.c.id).label("title_id"),
+            func.max(ranked_messages.c.id).label("preview_id"),
+        )
+        .where(ranked_messages.c.position <= 2)
+        .group_by(ranked_messages.c.chat_thread_id)
+        # Threads with a single message have no preview
+        .having(func.count() == 2)
+        .subquery("first_messages")
     )
-    threads = [thread for thread in threads if len(thread.messages) > 1]
+    title_message = aliased(DBChatMessage)
+    preview_message = aliased(DBChatMessage)
+
+    stmt = (
+        select(
+            DBChatThread.id,
+            DBChatThread.time_created,
+            DBChatThread.model_name,
+            title_message.content.label("title"),
+            preview_message.content.label("preview"),
+        )
+        .join(first_messages, first_messages.c.chat_thread_id == DBChatThread.id)
+        .join(title_message, title_message.id == first_messages.c.title_id)
+        .join(preview_message, preview_message.id == first_messages.c.preview_id)
+        .order_by(DBChatThread.time_created.desc())
+    )
+    threads = session.execute(stmt).all()
 
     snapshots = []
     for thread in threads:
-        title = thread.messages[0].content
-        preview = thread.messages[1].content
-
         # Remove citations from the preview
-        citation_regex = re.compile(r"\[[0-9]+\]")
-        preview = citation_regex.sub("", preview)
+        preview = CITATION_REGEX.sub("", thread.preview)
 
         snapshots.append(
             ChatSnapshot(
                 id=thread.id,
-                title=title,
+                title=thread.title,
                 date=thread.time_created,
                 preview=preview,
                 model_name=thread.model_name,
@@ -192,15 +214,37 @@ def map_search_result(search_result: DBSearchResult) -> SearchResult:
     )
 
 
+def map_agent_response(
+    agent_search_full_response: dict | str | None,
+) -> AgentSearchFullResponse | None:
+    if not agent_search_full_response:
+        return None
+    # Rows written before the column held a JSON object store an encoded string
+    if isinstance(agent_search_full_response, str):
+        return AgentSearchFullResponse.model_validate_json(agent_search_full_response)
+    return AgentSearchFullResponse.model_validate(agent_search_full_response)
+
+
 def get_thread(*, session: Session, thread_id: int) -> ThreadResponse:
     stmt = (
         select(DBChatMessage)
+        .options(
+            load_only(
+                DBChatMessage.content,
+                DBChatMessage.role,
+                DBChatMessage.related_queries,
+                DBChatMessage.image_results,
+                DBChatMessage.agent_search_full_response,
+            ),
+            selectinload(DBChatMessage.search_results).load_only(
+                DBSearchResult.url, DBSearchResult.title, DBSearchResult.content
+            ),
+        )
         .where(DBChatMessage.chat_thread_id == thread_id)
         .order_by(DBChatMessage.id.asc())
     )
-    db_messages = session.execute(stmt).scalars().all()
-    if len(db_messages) == 0:
-        raise ValueError(f"Thread with id {thread_id} not found")
+    # Stream rows in batches; search results are selectin-loaded per batch
+    db_messages = session.execute(stmt.execution_options(yield_per=100)).scalars()
 
     messages = [
         ChatMessage(
@@ -211,14 +255,11 @@ def get_thread(*, session: Session, thread_id: int) -> ThreadResponse:
                 map_search_result(result) for result in message.search_results or []
             ],
             images=message.image_results or [],
-            agent_response=(
-                AgentSearchFullResponse(
-                    **json.loads(message.agent_search_full_response)
-                )
-                if message.agent_search_full_response
-                else None
-            ),
+            agent_response=map_agent_response(message.agent_search_full_response),
         )
         for message in db_messages
     ]
+    if len(messages) == 0:
+        raise ValueError(f"Thread with id {thread_id} not found")
+
     return ThreadResponse(thread_id=thread_id, messages=messages)
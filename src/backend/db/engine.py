@@ -22,7 +22,14 @@ def create_connection_string():
     return DATABASE_URL
 
 
-engine = create_engine(create_connection_string())
+engine = create_engine(
+    create_connection_string(),
+    pool_use_lifo=True,
+    pool_size=50,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 
 
 def get_session():
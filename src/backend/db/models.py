@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import ARRAY, DateTime, Enum, ForeignKey, String, func
+from sqlalchemy import ARRAY, DateTime, Enum, ForeignKey, Index, String, func
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
 
@@ -35,7 +35,9 @@ class SearchResult(Base):
     url: Mapped[str] = mapped_column(String)
     content: Mapped[str] = mapped_column(String)
 
-    chat_message_id: Mapped[int] = mapped_column(ForeignKey("chat_message.id"))
+    chat_message_id: Mapped[int] = mapped_column(
+        ForeignKey("chat_message.id"), index=True
+    )
     chat_message: Mapped["ChatMessage"] = relationship(
         "ChatMessage", back_populates="search_results"
     )
@@ -43,6 +45,9 @@ class SearchResult(Base):
 
 class ChatMessage(Base):
     __tablename__ = "chat_message"
+    __table_args__ = (
+        Index("ix_chat_message_chat_thread_id_id", "chat_thread_id", "id"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     role: Mapped[MessageRole] = mapped_column(Enum(MessageRole))
     content: Mapped[str] = mapped_column(String)
@@ -56,7 +61,7 @@ class ChatMessage(Base):
     )
 
     # AI Only
-    agent_search_full_response: Mapped[str | None] = mapped_column(
+    agent_search_full_response: Mapped[dict | None] = mapped_column(
         postgresql.JSONB, nullable=True
     )
 
@@ -1,3 +1,4 @@
+import functools
 import os
 from abc import ABC, abstractmethod
 
@@ -14,6 +15,8 @@ from llama_index.llms.litellm import LiteLLM
 
 load_dotenv()
 
+os.environ.setdefault("OLLAMA_API_BASE", "http://localhost:11434")
+
 
 class BaseLLM(ABC):
     @abstractmethod
@@ -34,8 +37,6 @@ class EveryLLM(BaseLLM):
         self,
         model: str,
     ):
-        os.environ.setdefault("OLLAMA_API_BASE", "http://localhost:11434")
-
         validation = validate_environment(model)
         if validation["missing_keys"]:
             raise ValueError(f"Missing keys: {validation['missing_keys']}")
@@ -58,3 +59,8 @@ class EveryLLM(BaseLLM):
             messages=[{"role": "user", "content": prompt}],
             response_model=response_model,
         )
+
+
+@functools.lru_cache(maxsize=16)
+def get_llm(model: str) -> EveryLLM:
+    return EveryLLM(model=model)
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import os
 import traceback
 from typing import Generator
@@ -7,7 +6,6 @@ from typing import Generator
 import logfire
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Request
-from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
@@ -26,24 +24,37 @@ from backend.schemas import (
     ErrorStream,
     StreamEvent,
     ThreadResponse,
+    dump_event,
 )
-from backend.utils import strtobool
+from backend.utils import DB_ENABLED, strtobool
 from backend.validators import validate_model
 
 load_dotenv()
 
 
 def create_error_event(detail: str):
-    obj = ChatResponseEvent(
+    obj = ChatResponseEvent.model_construct(
         data=ErrorStream(detail=detail),
         event=StreamEvent.ERROR,
     )
     return ServerSentEvent(
-        data=json.dumps(jsonable_encoder(obj)),
+        data=dump_event(obj).decode(),
         event=StreamEvent.ERROR,
     )
 
 
+def encode_stream_event(obj: ChatResponseEvent) -> bytes:
+    # Same frame ServerSentEvent(data=...).encode() builds; orjson output is a
+    # single line, so the data needs no splitting
+    return b"data: " + dump_event(obj) + b"\r\n\r\n"
+
+
+# The rate limit response is identical for every request, so encode it once
+RATE_LIMIT_ERROR_EVENT = create_error_event(
+    "Rate limit exceeded, please try again later."
+)
+
+
 def configure_logging(app: FastAPI, logfire_token: str | None):
     if logfire_token:
         logfire.configure()
@@ -52,7 +63,7 @@ def configure_logging(app: FastAPI, logfire_token: str | None):
 
 async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
     def generator():
-        yield create_error_event("Rate limit exceeded, please try again later.")
+        yield RATE_LIMIT_ERROR_EVENT
 
     return EventSourceResponse(
         generator(),
@@ -111,8 +122,7 @@ async def chat(
             async for obj in stream_fn(request=chat_request, session=session):
                 if await request.is_disconnected():
                     break
-                yield json.dumps(jsonable_encoder(obj))
-                await asyncio.sleep(0)
+                yield encode_stream_event(obj)
         except Exception as e:
             print(traceback.format_exc())
             yield create_error_event(str(e))
@@ -124,7 +134,6 @@ async def chat(
 
 @app.get("/history")
 async def recents(session: Session = Depends(get_session)) -> ChatHistoryResponse:
-    DB_ENABLED = strtobool(os.environ.get("DB_ENABLED", "true"))
     if DB_ENABLED:
         try:
             history = get_chat_history(session=session)
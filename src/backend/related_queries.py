@@ -1,15 +1,34 @@
+import asyncio
+import io
+
 from backend.llm.base import BaseLLM
 from backend.prompts import RELATED_QUESTION_PROMPT
 from backend.schemas import RelatedQueries, SearchResult
 
+MAX_CONTEXT_LENGTH = 4000
+STRIP_QUESTION_MARKS = str.maketrans("", "", "?")
+
 
 async def generate_related_queries(
     query: str, search_results: list[SearchResult], llm: BaseLLM
 ) -> list[str]:
-    context = "\n\n".join([f"{str(result)}" for result in search_results])
-    context = context[:4000]
-    related = llm.structured_complete(
-        RelatedQueries, RELATED_QUESTION_PROMPT.format(query=query, context=context)
+    # Stop formatting results once the context is long enough to be truncated
+    buffer = io.StringIO()
+    for index, result in enumerate(search_results):
+        if index:
+            buffer.write("\n\n")
+        buffer.write(str(result))
+        if buffer.tell() >= MAX_CONTEXT_LENGTH:
+            break
+    context = buffer.getvalue()[:MAX_CONTEXT_LENGTH]
+    # structured_complete is a blocking call, keep it off the event loop
+    related = await asyncio.to_thread(
+        llm.structured_complete,
+        RelatedQueries,
+        RELATED_QUESTION_PROMPT.format(query=query, context=context),
     )
 
-    return [query.lower().replace("?", "") for query in related.related_questions]
+    return [
+        query.lower().translate(STRIP_QUESTION_MARKS)
+        for query in related.related_questions
+    ]
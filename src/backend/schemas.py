@@ -1,36 +1,35 @@
 # Some of the code here is based on github.com/cohere-ai/cohere-toolkit/
 
-import os
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import List, Union
+from enum import Enum, StrEnum
+from typing import TYPE_CHECKING, Annotated, List, Literal, Union
 
-from dotenv import load_dotenv
-from logfire.integrations.pydantic import PluginSettings
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 from backend.constants import ChatModel
-from backend.utils import strtobool
 
-load_dotenv()
+if TYPE_CHECKING:
+    from logfire.integrations.pydantic import PluginSettings
 
+# PluginSettings is a TypedDict, so the settings don't need logfire imported
+record_all: "PluginSettings" = {"logfire": {"record": "all"}}
 
-record_all = PluginSettings(logfire={"record": "all"})
 
-
-class MessageRole(str, Enum):
+class MessageRole(StrEnum):
     USER = "user"
     ASSISTANT = "assistant"
 
 
 class Message(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     content: str
     role: MessageRole
 
 
-LOCAL_MODELS_ENABLED = strtobool(os.getenv("ENABLE_LOCAL_MODELS", False))
-
-
 class ChatRequest(BaseModel, plugin_settings=record_all):
     thread_id: int | None = None
     query: str
@@ -43,13 +42,14 @@ class RelatedQueries(BaseModel):
     related_questions: List[str] = Field(..., min_length=3, max_length=3)
 
 
-class SearchResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SearchResult:
     title: str
     url: str
     content: str
 
     def __str__(self):
-        return f"Title: {self.title}\nURL: {self.url}\n Summary: {self.content}"
+        return f"Title: {self.title}\nURL: {self.url}\nSummary: {self.content}"
 
 
 class SearchResponse(BaseModel):
@@ -63,20 +63,23 @@ class AgentSearchStepStatus(str, Enum):
     DEFAULT = "default"
 
 
-class AgentSearchStep(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True)
+class AgentSearchStep:
     step_number: int
     step: str
-    queries: List[str] = Field(default_factory=list)
-    results: List[SearchResult] = Field(default_factory=list)
+    queries: tuple[str, ...] = ()
+    results: tuple[SearchResult, ...] = ()
     status: AgentSearchStepStatus = AgentSearchStepStatus.DEFAULT
 
 
 class AgentSearchFullResponse(BaseModel):
-    steps: list[str] = Field(default_factory=list)
-    steps_details: List[AgentSearchStep] = Field(default_factory=list)
+    model_config = ConfigDict(frozen=True)
+
+    steps: tuple[str, ...] = ()
+    steps_details: tuple[AgentSearchStep, ...] = ()
 
 
-class StreamEvent(str, Enum):
+class StreamEvent(StrEnum):
     BEGIN_STREAM = "begin-stream"
     SEARCH_RESULTS = "search-results"
     TEXT_CHUNK = "text-chunk"
@@ -93,90 +96,125 @@ class StreamEvent(str, Enum):
     AGENT_FULL_RESPONSE = "agent-full-response"
 
 
-class ChatObject(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ChatObject:
     event_type: StreamEvent
 
 
-class BeginStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.BEGIN_STREAM
+@dataclass(slots=True, kw_only=True)
+class BeginStream(ChatObject):
+    event_type: Literal[StreamEvent.BEGIN_STREAM] = StreamEvent.BEGIN_STREAM
     query: str
 
 
-class SearchResultStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.SEARCH_RESULTS
-    results: List[SearchResult] = Field(default_factory=list)
-    images: List[str] = Field(default_factory=list)
+@dataclass(slots=True, kw_only=True)
+class SearchResultStream(ChatObject):
+    event_type: Literal[StreamEvent.SEARCH_RESULTS] = StreamEvent.SEARCH_RESULTS
+    results: List[SearchResult] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
 
 
+@dataclass(slots=True, kw_only=True)
 class TextChunkStream(ChatObject):
-    event_type: StreamEvent = StreamEvent.TEXT_CHUNK
+    event_type: Literal[StreamEvent.TEXT_CHUNK] = StreamEvent.TEXT_CHUNK
     text: str
 
 
-class RelatedQueriesStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.RELATED_QUERIES
-    related_queries: List[str] = Field(default_factory=list)
+@dataclass(slots=True, kw_only=True)
+class RelatedQueriesStream(ChatObject):
+    event_type: Literal[StreamEvent.RELATED_QUERIES] = StreamEvent.RELATED_QUERIES
+    related_queries: List[str] = field(default_factory=list)
 
 
-class StreamEndStream(ChatObject, plugin_settings=record_all):
+@dataclass(slots=True, kw_only=True)
+class StreamEndStream(ChatObject):
     thread_id: int | None = None
-    event_type: StreamEvent = StreamEvent.STREAM_END
+    event_type: Literal[StreamEvent.STREAM_END] = StreamEvent.STREAM_END
 
 
-class FinalResponseStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.FINAL_RESPONSE
+@dataclass(slots=True, kw_only=True)
+class FinalResponseStream(ChatObject):
+    event_type: Literal[StreamEvent.FINAL_RESPONSE] = StreamEvent.FINAL_RESPONSE
     message: str
 
 
-class ErrorStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.ERROR
+@dataclass(slots=True, kw_only=True)
+class ErrorStream(ChatObject):
+    event_type: Literal[StreamEvent.ERROR] = StreamEvent.ERROR
     detail: str
 
 
-class AgentQueryPlanStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.AGENT_QUERY_PLAN
-    steps: List[str] = Field(default_factory=list)
+@dataclass(slots=True, kw_only=True)
+class AgentQueryPlanStream(ChatObject):
+    event_type: Literal[StreamEvent.AGENT_QUERY_PLAN] = StreamEvent.AGENT_QUERY_PLAN
+    steps: List[str] = field(default_factory=list)
 
 
-class AgentSearchQueriesStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.AGENT_SEARCH_QUERIES
+@dataclass(slots=True, kw_only=True)
+class AgentSearchQueriesStream(ChatObject):
+    event_type: Literal[StreamEvent.AGENT_SEARCH_QUERIES] = (
+        StreamEvent.AGENT_SEARCH_QUERIES
+    )
     step_number: int
-    queries: List[str] = Field(default_factory=list)
+    queries: List[str] = field(default_factory=list)
 
 
-class AgentReadResultsStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.AGENT_READ_RESULTS
+@dataclass(slots=True, kw_only=True)
+class AgentReadResultsStream(ChatObject):
+    event_type: Literal[StreamEvent.AGENT_READ_RESULTS] = StreamEvent.AGENT_READ_RESULTS
     step_number: int
-    results: List[SearchResult] = Field(default_factory=list)
+    results: List[SearchResult] = field(default_factory=list)
 
 
-class AgentSearchFullResponseStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.AGENT_FULL_RESPONSE
+@dataclass(slots=True, kw_only=True)
+class AgentSearchFullResponseStream(ChatObject):
+    event_type: Literal[StreamEvent.AGENT_FULL_RESPONSE] = (
+        StreamEvent.AGENT_FULL_RESPONSE
+    )
     response: AgentSearchFullResponse
 
 
-class AgentFinishStream(ChatObject, plugin_settings=record_all):
-    event_type: StreamEvent = StreamEvent.AGENT_FINISH
+@dataclass(slots=True, kw_only=True)
+class AgentFinishStream(ChatObject):
+    event_type: Literal[StreamEvent.AGENT_FINISH] = StreamEvent.AGENT_FINISH
 
 
+# Events are only built by the backend from typed payloads, so producers use
+# ChatResponseEvent.model_construct to skip validation; never use it for input
 class ChatResponseEvent(BaseModel):
     event: StreamEvent
-    data: Union[
-        BeginStream,
-        SearchResultStream,
-        TextChunkStream,
-        RelatedQueriesStream,
-        StreamEndStream,
-        FinalResponseStream,
-        ErrorStream,
-        AgentQueryPlanStream,
-        AgentSearchQueriesStream,
-        AgentReadResultsStream,
-        AgentFinishStream,
-        AgentSearchFullResponseStream,
+    data: Annotated[
+        Union[
+            BeginStream,
+            SearchResultStream,
+            TextChunkStream,
+            RelatedQueriesStream,
+            StreamEndStream,
+            FinalResponseStream,
+            ErrorStream,
+            AgentQueryPlanStream,
+            AgentSearchQueriesStream,
+            AgentReadResultsStream,
+            AgentFinishStream,
+            AgentSearchFullResponseStream,
+        ],
+        Field(discriminator="event_type"),
     ]
 
 
+def serialize_model(obj: BaseModel) -> dict:
+    return obj.model_dump(mode="json")
+
+
+# Stream payloads are dataclasses, so orjson can encode them without a
+# round trip through pydantic; only nested models fall back to model_dump
+def dump_event(event: ChatResponseEvent) -> bytes:
+    return orjson.dumps(
+        {name: getattr(event, name) for name in ChatResponseEvent.model_fields},
+        default=serialize_model,
+    )
+
+
 class ChatSnapshot(BaseModel):
     id: int
     title: str
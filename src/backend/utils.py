@@ -2,21 +2,28 @@ import os
 
 from backend.constants import ChatModel
 
-
-def is_local_model(model: ChatModel) -> bool:
-    return model in [
+LOCAL_MODELS = frozenset(
+    {
         ChatModel.LOCAL_LLAMA_3,
         ChatModel.LOCAL_GEMMA,
         ChatModel.LOCAL_MISTRAL,
         ChatModel.LOCAL_PHI3_14B,
         ChatModel.CUSTOM,
-    ]
+    }
+)
+
+
+def is_local_model(model: ChatModel) -> bool:
+    return model in LOCAL_MODELS
+
+
+TRUE_STRINGS = frozenset({"true", "1", "t"})
 
 
 def strtobool(val: str | bool) -> bool:
     if isinstance(val, bool):
         return val
-    return val.lower() in ("true", "1", "t")
+    return val.lower() in TRUE_STRINGS
 
 
 DB_ENABLED = strtobool(os.environ.get("DB_ENABLED", "true"))
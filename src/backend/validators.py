@@ -3,6 +3,9 @@ import os
 from backend.constants import ChatModel
 from backend.utils import is_local_model, strtobool
 
+GPT4_ENABLED = strtobool(os.getenv("GPT4_ENABLED", True))
+LOCAL_MODELS_ENABLED = strtobool(os.getenv("ENABLE_LOCAL_MODELS", True))
+
 
 def validate_model(model: ChatModel):
     if model in {ChatModel.GPT_4o_mini, ChatModel.GPT_4o}:
@@ -10,7 +13,6 @@ def validate_model(model: ChatModel):
         if not OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY environment variable not found")
         if model == ChatModel.GPT_4o:
-            GPT4_ENABLED = strtobool(os.getenv("GPT4_ENABLED", True))
             if not GPT4_ENABLED:
                 raise ValueError(
                     "GPT4-o has been disabled. Please try a different model or self-host the app by following the instructions here: https://github.com/rashadphz/farfalle"
@@ -21,7 +23,6 @@ def validate_model(model: ChatModel):
         if not GROQ_API_KEY:
             raise ValueError("GROQ_API_KEY environment variable not found")
     elif is_local_model(model):
-        LOCAL_MODELS_ENABLED = strtobool(os.getenv("ENABLE_LOCAL_MODELS", True))
         if not LOCAL_MODELS_ENABLED:
             raise ValueError("Local models are not enabled")
     else: